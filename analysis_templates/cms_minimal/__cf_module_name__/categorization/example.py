@@ -7,6 +7,7 @@ Exemplary selection methods.
 from columnflow.categorization import Categorizer, categorizer
 from columnflow.util import maybe_import
 
+np = maybe_import("numpy")
 ak = maybe_import("awkward")
 
 
@@ -17,7 +18,7 @@ ak = maybe_import("awkward")
 @categorizer(uses={"event"})
 def cat_incl(self: Categorizer, events: ak.Array, **kwargs) -> tuple[ak.Array, ak.Array]:
     # fully inclusive selection
-    return events, ak.ones_like(events.event) == 1
+    return events, np.ones(len(events), dtype=bool)
 
 
 @categorizer(uses={"Jet.pt"})
@@ -34,7 +34,7 @@ def muon_selection(
     **kwargs,
 ) -> tuple[ak.Array, SelectionResult]:
     # example muon selection: exactly one muon
-    muon_mask = (events.Muon.pt >= 20.0) & (abs(events.Muon.eta) < 2.1)
+    muon_mask = (events.Muon.pt >= 20.0) & (events.Muon.eta > -2.1) & (events.Muon.eta < 2.1)
     muon_sel = ak.sum(muon_mask, axis=1) == 1
 
     # build and return selection results
@@ -61,8 +61,9 @@ def jet_selection(
     **kwargs,
 ) -> tuple[ak.Array, SelectionResult]:
     # example jet selection: at least one jet
-    jet_mask = (events.Jet.pt >= 25.0) & (abs(events.Jet.eta) < 2.4)
-    jet_sel = ak.sum(jet_mask, axis=1) >= 1
+    jet_mask = (events.Jet.pt >= 25.0) & (events.Jet.eta > -2.4) & (events.Jet.eta < 2.4)
+    n_jets = ak.sum(jet_mask, axis=1)
+    jet_sel = n_jets >= 1
 
     # build and return selection results
     # "objects" maps source columns to new columns and selections to be applied on the old columns
@@ -77,7 +78,7 @@ def jet_selection(
             },
         },
         aux={
-            "n_jets": ak.sum(jet_mask, axis=1),
+            "n_jets": n_jets,
         },
     )
 
@@ -139,29 +140,29 @@ def example(
     # add cutflow features, passing per-object masks
     events = self[cutflow_features](events, results.objects, **kwargs)
 
-    # increment stats
+    # increment stats, converting columns used multiple times to numpy only once
+    event_sel = np.asarray(results.event)
     weight_map = {
         "num_events": Ellipsis,
-        "num_events_selected": results.event,
+        "num_events_selected": event_sel,
     }
     group_map = {}
     if self.dataset_inst.is_mc:
+        mc_weights = np.asarray(events.mc_weight)
         weight_map = {
             **weight_map,
             # mc weight for all events
-            "sum_mc_weight": (events.mc_weight, Ellipsis),
-            "sum_mc_weight_selected": (events.mc_weight, results.event),
+            "sum_mc_weight": (mc_weights, Ellipsis),
+            "sum_mc_weight_selected": (mc_weights, event_sel),
         }
         group_map = {
             # per process
             "process": {
                 "values": events.process_id,
-                "mask_fn": (lambda v: events.process_id == v),
             },
             # per jet multiplicity
             "njet": {
                 "values": results.x.n_jets,
-                "mask_fn": (lambda v: results.x.n_jets == v),
             },
         }
     events, results = self[increment_stats](
@@ -1146,6 +1146,12 @@ def sorted_indices_from_mask(
     :param ascending: Whether to sort in ascending order.
     :return: An array of sorted indices.
     """
+    # when sorting along the innermost axis, only sort the masked values and map them back to their
+    # original indices, which spares the gathering of the mask by sorted indices
+    if sort_axis in (-1, mask.ndim - 1):
+        indices = ak.local_index(mask, axis=sort_axis)[mask]
+        return indices[ak.argsort(metric[mask], axis=sort_axis, ascending=ascending)]
+
     indices = ak.argsort(metric, axis=sort_axis, ascending=ascending)
     return indices[mask[indices]]
 
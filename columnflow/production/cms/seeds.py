@@ -6,17 +6,19 @@ Methods related to creating event and object seeds.
 
 from __future__ import annotations
 
-import hashlib
 import abc
 
 import law
 
+from columnflow.types import Callable
 from columnflow.production import Producer, producer
-from columnflow.util import maybe_import, primes, InsertableDict
+from columnflow.util import maybe_import, memoize, primes, InsertableDict
 from columnflow.columnar_util import Route, set_ak_column, optional_column as optional
 
 np = maybe_import("numpy")
 ak = maybe_import("awkward")
+numba = maybe_import("numba")
+xxhash = maybe_import("xxhash")
 
 
 logger = law.logger.get_logger(__name__)
@@ -24,13 +26,119 @@ logger = law.logger.get_logger(__name__)
 
 def create_seed(val: int, n_hex: int = 16) -> int:
     """
-    Create a seed from an integer value by hashing it and returning the trailing 64 bit integer.
+    Create a seed from an integer value by hashing its 8-byte little-endian representation and
+    returning the 64 bit digest, masked to the lowest *n_hex* hex characters.
+
+    The hash only serves as a scrambler, so the non-cryptographic but considerably faster xxh3_64
+    is used. Note that this changed the values of all seeds once with respect to the previous
+    implementations based on sha256 and blake2b.
+    """
+    return xxhash.xxh3_64_intdigest(int(val).to_bytes(8, "little")) & ((1 << (4 * n_hex)) - 1)
+
+
+def create_seed_vec(vals: np.ndarray, n_hex: int = 16, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Vectorized version of :py:func:`create_seed` that hashes all *vals* from 8-byte chunks of a
+    single contiguous buffer, avoiding per-element conversions. When *out* is given, seeds are
+    written into it directly, which may also be *vals* itself for in-place hashing.
+    """
+    vals = np.asarray(vals)
+    raw = memoryview(np.ascontiguousarray(vals, dtype="<u8")).cast("B")
+    mask = (1 << (4 * n_hex)) - 1
+    if out is None:
+        out = np.empty(vals.shape, dtype=np.uint64)
+    flat_out = out.reshape(-1)
+    for i in range(vals.size):
+        flat_out[i] = xxhash.xxh3_64_intdigest(raw[i * 8:(i + 1) * 8]) & mask
+    return out
+
+
+@memoize
+def pow2_primes() -> np.ndarray:
+    """
+    Returns the :py:attr:`~columnflow.util.primes` as a uint64 array, tiled to the next power of two
+    in length so that indices can be wrapped with a bit mask of ``len(array) - 1`` instead of a
+    modulo operation. The array is created once and shared by all callers, and is therefore made
+    read-only.
+    """
+    arr = np.resize(np.array(primes, dtype=np.uint64), 1 << (len(primes) - 1).bit_length())
+    arr.flags.writeable = False
+    return arr
+
+
+def _hash_jagged_kernel(flat: np.ndarray, offsets: np.ndarray, shift: int, out: np.ndarray) -> None:
+    """
+    Kernel computing ``n + sum(v * loc) + sum(v**2 * loc)`` per event from *flat* object values
+    (each cast to int64 and incremented by *shift*) and event *offsets*, with ``loc`` being the
+    one-based local index of an object. Results are written into *out*.
+    """
+    for e in numba.prange(len(out)):
+        start, stop = offsets[e], offsets[e + 1]
+        s1 = 0
+        s2 = 0
+        for k in range(start, stop):
+            loc = k - start + 1
+            v = np.int64(flat[k]) + shift
+            s1 += v * loc
+            s2 += v * v * loc
+        out[e] = (stop - start) + s1 + s2
+
+
+def _mix_primes_kernel(
+    values: np.ndarray,
+    primes: np.ndarray,
+    prime_mask: int,
+    prime_offset: int,
+    seed: np.ndarray,
+) -> None:
+    """
+    Kernel that, for each event, multiplies all integer *values* of shape ``(n_values, n_events)``
+    with *primes* picked through their value plus *prime_offset*, wrapped by *prime_mask*, and adds
+    the products to *seed* in place.
+    """
+    for e in numba.prange(values.shape[1]):
+        s = seed[e]
+        for k in range(values.shape[0]):
+            v = values[k, e]
+            s += primes[(v + prime_offset) & prime_mask] * np.uint64(v)
+        seed[e] = s
+
+
+@memoize
+def jit_parallel(func: Callable) -> Callable:
+    """
+    Returns a version of *func* that is jit-compiled with numba in parallel mode. Compilation is
+    deferred to the first call as numba is only available in sandboxes.
     """
-    return int(hashlib.sha256(bytes(str(val), "utf-8")).hexdigest()[:-(n_hex + 1):-1], base=16)
+    return numba.njit(parallel=True)(func)
 
 
-# store a vectorized version (only interface, not actually simd'ing)
-create_seed_vec = np.vectorize(create_seed, otypes=[np.uint64])
+def hash_jagged(values: ak.Array, shift: int = 0, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Hashes the integer *values* of a jagged array (with one level of nesting) per event, shifting
+    each value by *shift* first, and returns the results as an int64 numpy array, which is *out*
+    when given. The computation is done in a single, parallel pass over the flat values.
+    """
+    # read flat values and offsets from the layout directly if possible,
+    # and only fall back to flattening for more complex layouts
+    layout = values.layout
+    if (
+        isinstance(layout, (ak.contents.ListOffsetArray, ak.contents.ListArray)) and
+        isinstance(layout.content, ak.contents.NumpyArray)
+    ):
+        layout = layout.to_ListOffsetArray64(False)
+        offsets = np.asarray(layout.offsets)
+        flat = np.asarray(layout.content.data)
+    else:
+        counts = ak.to_numpy(ak.num(values, axis=1))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        flat = ak.to_numpy(ak.flatten(values, axis=1))
+    if out is None:
+        out = np.empty(len(offsets) - 1, dtype=np.int64)
+    jit_parallel(_hash_jagged_kernel)(flat, offsets, np.int64(shift), out)
+
+    return out
 
 
 @producer(
@@ -63,8 +171,8 @@ def deterministic_event_seeds(self, events: ak.Array, **kwargs) -> ak.Array:
 
         1. gather a selection of unambiguous integer features
         2. multiply them with a vector of primes
-        3. use the resulting integer as an input to sha256 and hex-digest the result
-        4. reverse it and int-cast the leading 16 characters, leading to a 64 bit int
+        3. use the 8-byte representation of the resulting integer as an input to xxh3_64
+        4. use the resulting 64 bit int as the seed
 
     .. note::
 
@@ -72,59 +180,57 @@ def deterministic_event_seeds(self, events: ak.Array, **kwargs) -> ak.Array:
         particular objects per event. It is up to the user to bring them into the desired order
         before invoking this producer.
     """
-    # started from an already hashed seed based on event, run and lumi info multiplied with primes
-    seed = create_seed_vec(
-        np.asarray(
-            self.primes[7] * ak.values_astype(events.event, np.uint64) +
-            self.primes[5] * ak.values_astype(events.run, np.uint64) +
-            self.primes[3] * ak.values_astype(events.luminosityBlock, np.uint64),
-        ),
-        n_hex=14,
-    )
-
-    # start gathering global routes when available
-    global_routes = []
-
-    # event-based columns
-    for c in self.event_columns:
-        r = Route(c)
-        if self.apply_route(events, r) is not None:
-            global_routes.append(r)
-
-    # add routes for counts of jagged collections
-    for c in self.object_count_columns:
-        r = Route(c)
-        if (arr := self.apply_route(events, r)) is None:
-            continue
-        global_routes.append(r := Route(f"n{r[0]}"))
-        events = set_ak_column(events, r, ak.num(arr, axis=1), value_type=np.uint64)
-
-    # calculate seed from global routes
+    # started from an already hashed seed based on event, run and lumi info multiplied with primes,
+    # accumulated in-place in a single buffer
+    seed = ak.to_numpy(events.event).astype(np.uint64)
+    seed *= self.primes[7]
+    seed += self.primes[5] * ak.to_numpy(events.run).astype(np.uint64, copy=False)
+    seed += self.primes[3] * ak.to_numpy(events.luminosityBlock).astype(np.uint64, copy=False)
+    seed = create_seed_vec(seed, n_hex=14)
+
+    # offsets of values and prime indices
     value_offset = 3
     prime_offset = 15
-    for i, r in enumerate(global_routes, value_offset):
-        values = r.apply(events) + i
-        primes = self.primes[(values + prime_offset) % len(self.primes)]
-        seed = seed + primes * ak.values_astype(values, np.uint64)
-
-    # get integers of objects, perform a custom hashing involving local indices,
-    # then multiply with primes and add to the seed
-    for i, c in enumerate(self.object_columns, value_offset):
-        r = Route(c)
-        if (values := self.apply_route(events, r)) is None:
-            continue
-        values = ak.values_astype(values, np.int64) + i
-        loc = ak.local_index(values) + 1
-        hashed = (
-            ak.num(values, axis=-1) +
-            ak.sum(values * loc, axis=-1) +
-            ak.sum(values**2 * loc, axis=-1)
-        )
-        primes = self.primes[(hashed + prime_offset) % len(self.primes)]
-        seed = seed + primes * ak.values_astype(hashed, np.uint64)
 
-    # create and store them
-    seed = ak.Array(create_seed_vec(np.asarray(seed)))
+    # determine which of the optional routes are available once, as the event structure does not
+    # change between chunks
+    if self.available_event_routes is None:
+        self.available_event_routes = [
+            r for r in self.event_routes
+            if self.apply_route(events, r) is not None
+        ]
+        self.available_object_count_routes = [
+            (r, count_route) for r, count_route in self.object_count_routes
+            if self.apply_route(events, r) is not None
+        ]
+        self.available_object_routes = [
+            (i, r) for i, r in enumerate(self.object_routes, value_offset)
+            if self.apply_route(events, r) is not None
+        ]
+
+    # gather global values from event-based columns and counts of jagged collections
+    global_values = [r.apply(events) for r in self.available_event_routes]
+    for r, count_route in self.available_object_count_routes:
+        counts = ak.num(r.apply(events), axis=1)
+        events = set_ak_column(events, count_route, counts, value_type=np.uint64)
+        global_values.append(counts)
+
+    # get integers of objects for a custom hashing involving local indices (see hash_jagged)
+    object_values = [(i, r.apply(events)) for i, r in self.available_object_routes]
+
+    # gather all per-event integers, i.e., global values shifted by their position and hashed object
+    # values, then multiply them with primes and add them to the seed in a single parallel pass
+    n_global = len(global_values)
+    values = np.empty((n_global + len(object_values), len(seed)), dtype=np.int64)
+    for j, arr in enumerate(global_values):
+        values[j] = ak.to_numpy(arr)
+    values[:n_global] += np.arange(value_offset, value_offset + n_global)[:, None]
+    for j, (i, arr) in enumerate(object_values, n_global):
+        hash_jagged(arr, shift=i, out=values[j])
+    jit_parallel(_mix_primes_kernel)(values, self.primes, self.prime_mask, prime_offset, seed)
+
+    # create and store them, hashing in place
+    create_seed_vec(seed, out=seed)
     events = set_ak_column(events, "deterministic_seed", seed, value_type=np.uint64)
 
     # uniqueness test across the chunk for debugging
@@ -157,8 +263,19 @@ def deterministic_event_seeds_setup(
     """
     Setup function that defines conventions methods needed during the producer function.
     """
-    # store primes in array
-    self.primes = np.array(primes, dtype=np.uint64)
+    # store primes in array and the mask to wrap indices
+    self.primes = pow2_primes()
+    self.prime_mask = len(self.primes) - 1
+
+    # resolve routes once, including those of object counts that are added to events
+    self.event_routes = [Route(c) for c in self.event_columns]
+    self.object_count_routes = [(r := Route(c), Route(f"n{r[0]}")) for c in self.object_count_columns]
+    self.object_routes = [Route(c) for c in self.object_columns]
+
+    # routes that are actually available, determined in the first chunk
+    self.available_event_routes = None
+    self.available_object_count_routes = None
+    self.available_object_routes = None
 
     # helper to apply a route to an array with a silent failure that only issues a warning
     def apply_route(ak_array: ak.Array, route: Route) -> ak.Array | None:
@@ -205,16 +322,23 @@ class deterministic_object_seeds(Producer):
             The object seeds depend on the position of the particular object in the event. It is up to the
             user to bring them into the desired order before invoking this producer.
         """
-        # create the seeds
-        primes = self.primes[events.deterministic_seed % len(self.primes)]
-        object_seed = events.deterministic_seed + (
-            primes * ak.values_astype(
-                ak.local_index(events[self.object_field], axis=1) + self.primes[self.prime_offset],
-                np.uint64,
-            )
+        # create the seeds directly on flat arrays, with local indices inferred from object offsets
+        event_seed = ak.to_numpy(events.deterministic_seed).astype(np.uint64, copy=False)
+        counts = ak.to_numpy(ak.num(events[self.object_field], axis=1))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        local_index = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+        np_object_seed = np.repeat(event_seed, counts)
+        np_object_seed += (
+            np.repeat(self.primes[event_seed & self.prime_mask], counts) *
+            (local_index.astype(np.uint64) + self.primes[self.prime_offset])
         )
-        np_object_seed = np.asarray(ak.flatten(object_seed))
-        np_object_seed[:] = create_seed_vec(np_object_seed)
+        create_seed_vec(np_object_seed, out=np_object_seed)
+        # wrap the flat seeds into a jagged array that uses the buffer as its content without copies
+        object_seed = ak.Array(ak.contents.ListOffsetArray(
+            ak.index.Index64(offsets),
+            ak.contents.NumpyArray(np_object_seed),
+        ))
 
         # store them
         events = set_ak_column(events, f"{self.object_field}.deterministic_seed", object_seed, value_type=np.uint64)
@@ -239,14 +363,16 @@ class deterministic_object_seeds(Producer):
     ) -> None:
         """Setup before entering the event chunk loop.
 
-        Saves the :py:attr:`~columnflow.util.primes` in an numpy array for later use.
+        Saves the :py:attr:`~columnflow.util.primes` in an numpy array for later use, see
+        :py:func:`pow2_primes`.
 
         :param reqs: Resolved requirements (not used).
         :param inputs: Dictionary for inputs (not used).
         :param reader_targets: Dictionary for additional column to retrieve (not used).
         """
-        # store primes in array
-        self.primes = np.array(primes, dtype=np.uint64)
+        # store primes in array and the mask to wrap indices
+        self.primes = pow2_primes()
+        self.prime_mask = len(self.primes) - 1
 
 
 deterministic_jet_seeds = deterministic_object_seeds.derive(
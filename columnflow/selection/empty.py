@@ -75,7 +75,6 @@ def empty(
         # per process
         "process": {
             "values": events.process_id,
-            "mask_fn": (lambda v: events.process_id == v),
         },
     }
     events, _ = self[increment_stats](
@@ -71,7 +71,10 @@ def increment_stats(
     mapping the name of a group (e.g. ``"process"`` or ``"njet"``) to a dictionary with the fields
 
         - ``"values"``, unique values to loop over,
-        - ``"mask_fn"``, a function that is supposed to return a mask given a single value, and
+        - ``"mask_fn"`` (optional), a function that is supposed to return a mask given a single
+            value; when missing, *values* must contain exactly one value per event and the sums are
+            computed for all unique values at once in a single pass, which is considerably faster
+            for groups with many unique values, and
         - ``"combinations_only"`` (optional), a boolean flag (*False* by default) that decides
             whether this group is not to be evaluated on its own, but only as part of a combination
             with other groups (see below).
@@ -83,7 +86,6 @@ def increment_stats(
         group_map = {
             "process": {
                 "values": events.process_id,
-                "mask_fn": (lambda v: events.process_id == v),
             },
             "njet": {
                 "values": results.x.n_jets,
@@ -119,11 +121,19 @@ def increment_stats(
     if skip_func is None:
         skip_func = lambda weight_name, group_names: False
 
-    # make values in group map unique
-    unique_group_values = {
-        group_name: np.unique(ak.flatten(group_data["values"], axis=None))
-        for group_name, group_data in group_map.items()
-    }
+    # make values in group map unique, and for groups without a mask function, also store the
+    # index of the unique value per event
+    group_map = group_map or {}
+    unique_group_values = {}
+    group_indices = {}
+    for group_name, group_data in group_map.items():
+        if "mask_fn" in group_data:
+            unique_group_values[group_name] = np.unique(ak.flatten(group_data["values"], axis=None))
+        else:
+            unique_group_values[group_name], group_indices[group_name] = np.unique(
+                ak.to_numpy(group_data["values"]),
+                return_inverse=True,
+            )
 
     # treat groups as combinations of a single group
     group_combinations = list(group_combinations or [])
@@ -188,12 +198,39 @@ def increment_stats(
                 dtype = int if op == self.NUM else float
                 stats[group_key] = self.defaultdicts[dtype][len(group_names)]()
 
+            # when no group requires a mask function, compute the results for all combinations of
+            # values in a single pass by binning the flat index of the combination per event
+            all_values = itertools.product(*(unique_group_values[g] for g in group_names))
+            if all(g in group_indices for g in group_names):
+                mask = np.asarray(weight_mask, dtype=bool)
+                flat_indices = np.ravel_multi_index(
+                    [group_indices[g][mask] for g in group_names],
+                    [len(unique_group_values[g]) for g in group_names],
+                )
+                n_bins = np.prod([len(unique_group_values[g]) for g in group_names], dtype=np.int64)
+                if op == self.NUM:
+                    binned = np.bincount(flat_indices, minlength=n_bins)
+                else:  # SUM
+                    binned = np.bincount(
+                        flat_indices,
+                        weights=np.asarray(weights)[mask],
+                        minlength=n_bins,
+                    )
+                for values, value in zip(all_values, binned):
+                    str_values = list(map(str, values))
+                    innermost_dict = reduce(getitem_, [stats[group_key]] + str_values[:-1])
+                    innermost_dict[str_values[-1]] += int(value) if op == self.NUM else float(value)
+                continue
+
             # set values
-            for values in itertools.product(*(unique_group_values[g] for g in group_names)):
+            for values in all_values:
                 # evaluate and join the masks
                 group_mask = reduce(
                     and_,
-                    (group_map[g]["mask_fn"](v) for g, v in zip(group_names, values)),
+                    (
+                        group_map[g]["mask_fn"](v) if g not in group_indices else group_map[g]["values"] == v
+                        for g, v in zip(group_names, values)
+                    ),
                 )
                 # find the innermost dict to perform the in-place item assignment, then increment
                 str_values = list(map(str, values))
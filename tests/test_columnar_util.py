@@ -9,7 +9,7 @@ from columnflow.util import maybe_import
 from columnflow.columnar_util import (
     Route, ArrayFunction, get_ak_routes, has_ak_column, set_ak_column, remove_ak_column,
     add_ak_alias, add_ak_aliases, update_ak_array, flatten_ak_array, sort_ak_fields,
-    attach_behavior, layout_ak_array, flat_np_view,
+    attach_behavior, layout_ak_array, flat_np_view, sorted_indices_from_mask,
 )
 
 np = maybe_import("numpy")
@@ -823,3 +823,16 @@ class ColumnarUtilFunctionsTest(unittest.TestCase):
         muon_pt *= 2.0
         self.assertEqual(tuple(arr.Muon.pt[0]), (90.0, 110.0))
         self.assertEqual(tuple(muon_pt), (90.0, 110.0))
+
+    def test_sorted_indices_from_mask(self):
+        mask = ak.Array([[True, False, False, True], [], [False, True, True]])
+        metric = ak.Array([[5.0, 1.0, 0.9, 4.1], [], [3.0, 2.0, 2.0]])
+
+        indices = sorted_indices_from_mask(mask, metric)
+        self.assertEqual(indices.to_list(), [[3, 0], [], [1, 2]])
+
+        indices = sorted_indices_from_mask(mask, metric, ascending=False)
+        self.assertEqual(indices.to_list(), [[0, 3], [], [1, 2]])
+
+        indices = sorted_indices_from_mask(mask, metric, sort_axis=1, ascending=False)
+        self.assertEqual(indices.to_list(), [[0, 3], [], [1, 2]])